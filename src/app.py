@@ -1,15 +1,18 @@
+import asyncio
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import streamlit as st
 from typing import Dict, List, Optional, Tuple
-import json
-from datetime import datetime
-from tmdbv3api import TMDb, TV, Search, Season
 from dotenv import load_dotenv
+import httpx
+import orjson
 import re
+import time
 from pathlib import Path
-import pandas as pd
 import tempfile
 import shutil
+from src.utils.rate_limiter import TMDB_LIMITER
 
 # Load environment variables
 load_dotenv()
@@ -127,21 +130,396 @@ st.markdown(
 )
 
 
+# The six filename layouts understood by extract_show_info, fused into a
+# single alternation so each filename is scanned once instead of once per
+# pattern. Every alternative carries its own named groups; which episode
+# group matched tells us the layout.
+_SHOW_INFO_RE = re.compile(
+    # [Tag]Show_-_01 (episode-only format)
+    r"\[.*?\](?P<eo_show>.*?)[-_\s]*(?P<eo_ep>\d{2,})"
+    # Show.Name.S01E02 or Show.Name.S1E02
+    r"|(?P<se_show>.*?)[\.\s][Ss](?P<se_season>\d{1,2})[Ee](?P<se_ep>\d{1,2})"
+    # Show.Name.1x02 or Show.Name.01x02
+    r"|(?P<x_show>.*?)[\.\s](?P<x_season>\d{1,2})x(?P<x_ep>\d{1,2})"
+    # Show.Name.102 (where first digit is season, next two are episode)
+    r"|(?P<n_show>.*?)[\.\s](?P<n_season>\d)(?P<n_ep>\d{2})"
+    # Show.Name.Season.1.Episode.02
+    r"|(?P<w_show>.*?)[\.\s][Ss]eason[\.\s]?(?P<w_season>\d{1,2})"
+    r"[\.\s][Ee]pisode[\.\s]?(?P<w_ep>\d{1,2})"
+    # Show.Name.E02.S01 (episode before season)
+    r"|(?P<es_show>.*?)[\.\s][Ee](?P<es_ep>\d{1,2})[\.\s][Ss](?P<es_season>\d{1,2})",
+    re.IGNORECASE,
+)
+
+# (show group, season group, episode group) per alternative; a None season
+# group means the layout carries no season and defaults to season 1.
+_SHOW_INFO_GROUPS = (
+    ("eo_show", None, "eo_ep"),
+    ("se_show", "se_season", "se_ep"),
+    ("x_show", "x_season", "x_ep"),
+    ("n_show", "n_season", "n_ep"),
+    ("w_show", "w_season", "w_ep"),
+    ("es_show", "es_season", "es_ep"),
+)
+
+# Strips dots, underscores, and brackets out of extracted show names.
+_NAME_JUNK_RE = re.compile(r"[\._\[\]]")
+
+
+def _parse_filenames(names: List[str]) -> "pd.DataFrame":
+    """Parse a batch of filenames into name/show/season/episode columns.
+
+    One vectorized Series.str.extract pass over the fused pattern replaces
+    a Python-level extract_show_info call per file. Rows that match no
+    layout get NaN season/episode.
+    """
+    import pandas as pd
+
+    series = pd.Series(names, dtype="object")
+    extracted = series.str.extract(_SHOW_INFO_RE)
+
+    # Only the matched alternative's groups are non-null per row, so the
+    # per-layout columns coalesce into one show/season/episode trio.
+    show = extracted[[g[0] for g in _SHOW_INFO_GROUPS]].bfill(axis=1).iloc[:, 0]
+    season_cols = [g[1] for g in _SHOW_INFO_GROUPS if g[1] is not None]
+    season = pd.to_numeric(
+        extracted[season_cols].bfill(axis=1).iloc[:, 0], errors="coerce"
+    )
+    episode = pd.to_numeric(
+        extracted[[g[2] for g in _SHOW_INFO_GROUPS]].bfill(axis=1).iloc[:, 0],
+        errors="coerce",
+    )
+
+    parsed = pd.DataFrame({"name": series, "show": show})
+    parsed["episode"] = episode
+    # Episode-only layouts carry no season; default them to season 1
+    parsed["season"] = season.where(~(episode.notna() & season.isna()), 1)
+    return parsed
+
+# TMDB metadata changes rarely, so cached lookups stay valid for a week.
+TMDB_CACHE_TTL = 604800
+
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+
+@st.cache_resource(show_spinner=False)
+def _http_client() -> httpx.Client:
+    """Shared TMDB client with HTTP/2 and connection keep-alive.
+
+    One persistent client means requests reuse the TCP/TLS connection
+    instead of paying a handshake per call, and HTTP/2 lets concurrent
+    requests multiplex over it.
+    """
+    return httpx.Client(
+        base_url=TMDB_BASE_URL,
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+
+
+def _tmdb_get(path: str, **params) -> Dict:
+    """Issue a GET against the TMDB API and return the decoded JSON.
+
+    Same limiter and 429 handling as the async helper, over the shared
+    keep-alive client.
+    """
+    params.setdefault("api_key", os.getenv("TMDB_API_KEY"))
+    client = _http_client()
+    TMDB_LIMITER.acquire()
+    response = client.get(path, params=params)
+    if response.status_code == 429:
+        time.sleep(float(response.headers.get("Retry-After", 1)))
+        TMDB_LIMITER.acquire()
+        response = client.get(path, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@st.cache_resource(show_spinner=False)
+def _season_prefetch_store() -> Dict[Tuple[int, int], Dict]:
+    """Process-wide store of prefetched season payloads.
+
+    Keyed by (show_id, season_num) and consumed by _fetch_show_and_season
+    on a cache miss. This module is Streamlit's main script, so its
+    globals are rebuilt on every rerun; the store has to live in the
+    resource cache to survive from the submit that warms it to the rerun
+    that reads it.
+    """
+    return {}
+
+
+async def _aget_json(client: httpx.AsyncClient, path: str, **params) -> Dict:
+    """Issue an async GET against the TMDB API and return the decoded JSON.
+
+    Every request takes a token from the shared limiter first; a 429 is
+    retried once after honoring the Retry-After header.
+    """
+    params.setdefault("api_key", os.getenv("TMDB_API_KEY"))
+    await TMDB_LIMITER.acquire_async()
+    response = await client.get(f"{TMDB_BASE_URL}{path}", params=params)
+    if response.status_code == 429:
+        await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+        await TMDB_LIMITER.acquire_async()
+        response = await client.get(f"{TMDB_BASE_URL}{path}", params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _gather_show_and_season(show_id: int, season_num: int) -> Dict:
+    """Fetch the combined show+season payload, prefetching the next season.
+
+    Both GETs share one connection pool and run concurrently, so warming
+    the season the user is likely to open next costs no extra wall-clock
+    time. A failed prefetch (e.g. past the last season) is ignored.
+    """
+    async with httpx.AsyncClient(http2=True, timeout=10.0) as client:
+        payload, prefetched = await asyncio.gather(
+            _aget_json(
+                client, f"/tv/{show_id}", append_to_response=f"season/{season_num}"
+            ),
+            _aget_json(
+                client,
+                f"/tv/{show_id}",
+                append_to_response=f"season/{season_num + 1}",
+            ),
+            return_exceptions=True,
+        )
+
+    if isinstance(payload, Exception):
+        raise payload
+    if not isinstance(prefetched, Exception):
+        store = _season_prefetch_store()
+        if len(store) > 64:
+            store.clear()
+        store[(show_id, season_num + 1)] = prefetched
+    return payload
+
+
+@st.cache_data(ttl=TMDB_CACHE_TTL, show_spinner=False, max_entries=512)
+def _search_tv_shows(query: str) -> List[Dict]:
+    """Search TMDB for TV shows, cached across sessions and reruns."""
+    results = []
+    for show in _tmdb_get("/search/tv", query=query).get("results", []):
+        # Create a clean show object with essential info
+        show_data = {
+            "id": show["id"],
+            "name": show["name"],
+            "first_air_date": show.get("first_air_date") or "N/A",
+            "overview": show.get("overview") or "",
+            "original_name": show.get("original_name") or show["name"],
+        }
+
+        # Format display name
+        year = (
+            show_data["first_air_date"][:4]
+            if show_data["first_air_date"] != "N/A"
+            else "N/A"
+        )
+        show_data["display_name"] = f"{show_data['name']} ({year})"
+
+        results.append(show_data)
+
+    return results
+
+
+async def _gather_seasons(show_id: int, seasons: Tuple[int, ...]) -> None:
+    """Warm the prefetch store for several seasons of one show at once.
+
+    All GETs run concurrently under a semaphore capped at TMDB's request
+    ceiling, so N seasons cost roughly one round trip instead of N. Failed
+    fetches are dropped; the on-demand path will retry them.
+    """
+    sem = asyncio.Semaphore(40)
+
+    async def fetch_one(client, season_num):
+        async with sem:
+            return season_num, await _aget_json(
+                client, f"/tv/{show_id}", append_to_response=f"season/{season_num}"
+            )
+
+    async with httpx.AsyncClient(http2=True, timeout=10.0) as client:
+        results = await asyncio.gather(
+            *(fetch_one(client, s) for s in seasons), return_exceptions=True
+        )
+
+    store = _season_prefetch_store()
+    for result in results:
+        if not isinstance(result, Exception):
+            season_num, payload = result
+            store[(show_id, season_num)] = payload
+
+
+def _prefetch_seasons(show_id: int, seasons: set) -> None:
+    """Bulk-fetch the given seasons of one show into the prefetch store."""
+    store = _season_prefetch_store()
+    pending = tuple(
+        s for s in sorted(seasons) if (show_id, s) not in store
+    )
+    if pending:
+        asyncio.run(_gather_seasons(show_id, pending))
+
+
+@st.cache_resource(show_spinner=False)
+def _search_coalescer() -> Tuple[Dict[str, Future], threading.Lock, ThreadPoolExecutor]:
+    """In-flight search futures keyed by normalized query, plus their lock
+    and worker pool.
+
+    Coalescing only works if concurrent callers see the same map, so all
+    three live in the resource cache; as main-script globals they would be
+    rebuilt (executor included) on every rerun.
+    """
+    return (
+        {},
+        threading.Lock(),
+        ThreadPoolExecutor(max_workers=4, thread_name_prefix="tmdb-search"),
+    )
+
+
+def _coalesced_search(query: str) -> List[Dict]:
+    """Run a show search, collapsing duplicate concurrent queries.
+
+    The first caller for a query submits the real lookup; callers that
+    arrive while it is in flight block on the same future and share its
+    result.
+    """
+    inflight, lock, pool = _search_coalescer()
+    with lock:
+        future = inflight.get(query)
+        if future is None:
+            future = pool.submit(_search_tv_shows, query)
+            inflight[query] = future
+            future.add_done_callback(
+                lambda _f, key=query: inflight.pop(key, None)
+            )
+    return future.result()
+
+
+@st.cache_data(ttl=TMDB_CACHE_TTL, show_spinner=False, max_entries=512)
+def _fetch_show_and_season(show_id: int, season_num: int) -> Optional[Dict]:
+    """Fetch show details and one season's episodes in a single TMDB request.
+
+    Uses append_to_response so the season payload rides along with the show
+    details instead of costing a second round trip. On a cache miss a
+    prefetched payload is used before falling back to the network.
+    """
+    payload = _season_prefetch_store().pop((show_id, season_num), None)
+    if payload is None:
+        payload = asyncio.run(_gather_show_and_season(show_id, season_num))
+    if not payload:
+        return None
+    season = payload.get(f"season/{season_num}") or {}
+    return {
+        "number_of_seasons": payload.get("number_of_seasons", 0),
+        "season_number": season_num,
+        "episodes": [
+            {"episode_number": ep["episode_number"], "name": ep["name"]}
+            for ep in season.get("episodes", [])
+        ],
+    }
+
+
+# Upload buffers older than this are considered abandoned and swept.
+UPLOAD_TTL_SECS = 3600
+
+
+def _sweep_uploads(upload_dir: str, max_age_secs: int = UPLOAD_TTL_SECS) -> None:
+    """Delete upload temp files older than max_age_secs.
+
+    Bounds disk usage to recent uploads even when a rename batch never
+    fully succeeds and the success-path cleanup never runs.
+    """
+    if not os.path.isdir(upload_dir):
+        return
+    cutoff = time.time() - max_age_secs
+    for path in Path(upload_dir).glob("*"):
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+@st.cache_resource(show_spinner=False)
+def _sweep_uploads_once(upload_dir: str) -> bool:
+    """Run the upload sweep once per process rather than per rerun."""
+    _sweep_uploads(upload_dir)
+    return True
+
+
+def _index_downloads(downloads_dir: str) -> Dict[str, str]:
+    """Index every file in the Downloads subfolders as {filename: path}.
+
+    os.scandir reuses the stat data returned by the directory read, so
+    the whole index costs one pass instead of a listdir/isdir/exists
+    probe per file.
+    """
+    index: Dict[str, str] = {}
+    try:
+        for entry in os.scandir(downloads_dir):
+            if entry.is_dir(follow_symlinks=False):
+                for sub in os.scandir(entry.path):
+                    index[sub.name] = sub.path
+    except OSError:
+        pass
+    return index
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _downloads_file_names(downloads_dir: str, mtime_ns: int) -> frozenset:
+    """Walk the Downloads subfolders once and return every filename.
+
+    mtime_ns keys the cache so reruns within the TTL reuse the walk while
+    a changed Downloads directory still invalidates it.
+    """
+    return frozenset(_index_downloads(downloads_dir))
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _build_file_table(
+    files: Tuple[Tuple[str, str], ...],
+    renamed: Tuple[Tuple[str, str], ...],
+    downloads_dir: str,
+    mtime_ns: int,
+) -> "pd.DataFrame":
+    """Build the display table for the current files and rename plan.
+
+    Takes immutable tuples rather than session-state objects so Streamlit
+    can hash the arguments; reruns with unchanged files, rename plan, and
+    Downloads mtime reuse the cached DataFrame instead of rebuilding it.
+    """
+    import pandas as pd
+
+    # With no renames planned nothing can exist on disk under a new name,
+    # so the Downloads walk is skipped entirely
+    existing_names = (
+        _downloads_file_names(downloads_dir, mtime_ns) if renamed else frozenset()
+    )
+    renamed_map = dict(renamed)
+
+    data = []
+    for name, status in files:
+        new_name = renamed_map.get(name, "")
+        if not new_name:
+            data.append({"Original Name": name, "New Name": "", "Status": status})
+            continue
+        # A new name present on disk means the rename went through
+        if new_name in existing_names:
+            status = "Success"
+        data.append(
+            {"Original Name": name, "New Name": new_name, "Status": status}
+        )
+    return pd.DataFrame(data)
+
+
 class StreamlitTVShowRenamer:
     """Streamlit interface for TV show renaming."""
 
     def __init__(self):
         """Initialize the Streamlit TV show renamer."""
-        # Initialize TMDb
-        self.tmdb = TMDb()
-        self.tmdb.api_key = os.getenv("TMDB_API_KEY")
-        if not self.tmdb.api_key:
+        if not os.getenv("TMDB_API_KEY"):
             st.error("TMDB API key not found. Please check your .env file.")
             return
 
-        self.tv = TV()
-        self.season_api = Season()
-
         # Initialize session state variables
         if "files" not in st.session_state:
             st.session_state.files = []
@@ -149,76 +527,34 @@ class StreamlitTVShowRenamer:
             st.session_state.renamed_files = {}
         if "selected_show" not in st.session_state:
             st.session_state.selected_show = None
-        if "show_search_results" not in st.session_state:
-            st.session_state.show_search_results = {}
         if "current_directory" not in st.session_state:
             st.session_state.current_directory = str(Path.home() / "Downloads")
 
+        # Sweep upload buffers left behind by failed or abandoned
+        # batches; cached so it runs once per process, not per rerun
+        _sweep_uploads_once(os.path.join(os.getcwd(), "uploads"))
+
     def search_tv_show(self, query: str) -> List[Dict]:
-        """Search for TV shows using TMDB API and cache results."""
+        """Search for TV shows through the shared TMDB cache."""
         try:
-            # Check if we have cached results for this query
-            cache_key = query.lower().strip()
-            if cache_key in st.session_state.show_search_results:
-                return st.session_state.show_search_results[cache_key]
-
-            # Get search results
-            shows = self.tv.search(query)
-            results = []
-
-            for show in shows:
-                # Create a clean show object with essential info
-                show_data = {
-                    "id": show.id,
-                    "name": show.name,
-                    "first_air_date": getattr(show, "first_air_date", "N/A"),
-                    "overview": (
-                        getattr(show, "overview", "")
-                        if hasattr(show, "overview")
-                        else ""
-                    ),
-                    "original_name": getattr(show, "original_name", show.name),
-                }
-
-                # Format display name
-                year = (
-                    show_data["first_air_date"][:4]
-                    if show_data["first_air_date"] != "N/A"
-                    else "N/A"
-                )
-                show_data["display_name"] = f"{show_data['name']} ({year})"
-
-                results.append(show_data)
-
-            # Cache the results
-            st.session_state.show_search_results[cache_key] = results
-            return results
-
+            # Normalize the query so equivalent searches share one cache entry
+            return _coalesced_search(query.lower().strip())
         except Exception as e:
             st.error(f"Error searching for shows: {str(e)}")
             return []
 
-    def get_season_details(self, show_id: int, season_num: int):
-        """Get detailed information about a specific season."""
-        try:
-            season_details = self.season_api.details(show_id, season_num)
-            if not season_details:
-                st.warning(f"No season found for show {show_id}, season {season_num}")
-                return None
-            return season_details
-        except Exception as e:
-            st.error(f"Error getting season details: {str(e)}")
-            return None
-
     def select_tv_show(self):
         """Handle TV show selection and display season/episode selection."""
         if not st.session_state.files:
             return
 
-        # Show search box
+        # Show search box; very short queries are skipped so each
+        # keystroke of a fresh search doesn't hit TMDB
         query = st.text_input("Search for TV Show", key="show_search")
 
-        if query:
+        if query and len(query.strip()) < 3:
+            st.info("Type at least 3 characters to search")
+        elif query:
             show_names = self.search_tv_show(query)
             if show_names:
                 # Display show selection dropdown
@@ -290,32 +626,70 @@ class StreamlitTVShowRenamer:
                         # Add some spacing
                         st.markdown("<br>", unsafe_allow_html=True)
 
-                        # Get show details for seasons
-                        details = self.tv.details(show["id"])
-                        if details and hasattr(details, "number_of_seasons"):
+                        # One request carries both the season list and the
+                        # episodes for the currently selected season
+                        # (season 1 on first render).
+                        selected_season = st.session_state.get("season_select", 1)
+                        details = _fetch_show_and_season(
+                            show["id"], selected_season
+                        )
+                        if details and details["number_of_seasons"]:
                             season_numbers = list(
-                                range(1, details.number_of_seasons + 1)
-                            )
-                            selected_season = st.selectbox(
-                                "Select Season",
-                                season_numbers,
-                                format_func=lambda x: f"Season {x}",
+                                range(1, details["number_of_seasons"] + 1)
                             )
 
-                            if selected_season:
-                                # Get season details
-                                season_details = self.get_season_details(
-                                    show["id"], selected_season
+                            # The season pick and file matching live in a
+                            # form, so the fetch+match work runs once per
+                            # submit instead of on every widget change
+                            with st.form("episode_matcher"):
+                                selected_season = st.selectbox(
+                                    "Select Season",
+                                    season_numbers,
+                                    format_func=lambda x: f"Season {x}",
+                                    key="season_select",
                                 )
-                                if season_details and hasattr(
-                                    season_details, "episodes"
+                                submitted = st.form_submit_button("Match Files")
+
+                            if submitted and selected_season:
+                                # Uploads can span several seasons; warm
+                                # them all concurrently once per show/file
+                                # set so later submits are instant
+                                parsed = _parse_filenames(
+                                    [f["name"] for f in st.session_state.files]
+                                )
+                                needed = set(
+                                    parsed["season"].dropna().astype(int)
+                                ) - {selected_season}
+                                prefetch_key = (
+                                    show["id"],
+                                    tuple(sorted(needed)),
+                                )
+                                if needed and (
+                                    st.session_state.get("season_prefetch_key")
+                                    != prefetch_key
                                 ):
-                                    # Process files for the selected show and season
+                                    _prefetch_seasons(show["id"], needed)
+                                    st.session_state.season_prefetch_key = (
+                                        prefetch_key
+                                    )
+
+                                details = _fetch_show_and_season(
+                                    show["id"], selected_season
+                                )
+                                if details and details.get("episodes"):
+                                    # Process files for the selected show
+                                    # and season
                                     self.process_files_for_season(
                                         show["name"],
                                         show["id"],
                                         selected_season,
-                                        season_details,
+                                        details,
+                                    )
+                                else:
+                                    st.warning(
+                                        f"No season found for show "
+                                        f"{show['id']}, season "
+                                        f"{selected_season}"
                                     )
                         else:
                             st.error("Could not fetch show details")
@@ -326,45 +700,42 @@ class StreamlitTVShowRenamer:
         self, show_name: str, show_id: int, season: int, season_details
     ):
         """Process files for the selected show and season."""
-        success_count = 0
-        skipped_count = 0
-        failed_count = 0
-
-        with st.spinner("Processing files..."):
-            for file in st.session_state.files:
-                try:
-                    show_info = self.extract_show_info(file["name"])
-                    if not show_info:
-                        failed_count += 1
-                        continue
+        if not st.session_state.files:
+            return
 
-                    _, file_season, episode = show_info
+        import pandas as pd
 
-                    # Skip files from different seasons
-                    if file_season != season:
-                        skipped_count += 1
-                        continue
+        with st.spinner("Processing files..."):
+            # One vectorized parse over every filename, then a hash join
+            # against the season's episode list instead of a linear scan
+            # per file
+            parsed = _parse_filenames([f["name"] for f in st.session_state.files])
+            episodes_df = pd.DataFrame(
+                season_details["episodes"], columns=["episode_number", "name"]
+            ).drop_duplicates("episode_number")
+            merged = parsed.merge(
+                episodes_df.rename(columns={"name": "episode_name"}),
+                left_on="episode",
+                right_on="episode_number",
+                how="left",
+            )
 
-                    # Process files with matching season
-                    matching_episode = next(
-                        (
-                            ep
-                            for ep in season_details.episodes
-                            if ep.episode_number == episode
-                        ),
-                        None,
-                    )
+            unparsed = merged["episode"].isna()
+            same_season = merged["season"] == season
+            matched = merged[same_season & merged["episode_name"].notna()]
 
-                    if matching_episode:
-                        extension = os.path.splitext(file["name"])[1]
-                        new_name = f"{show_name}-S{season:02d}E{episode:02d}-{matching_episode.name}{extension}"
-                        st.session_state.renamed_files[file["name"]] = new_name
-                        success_count += 1
-                    else:
-                        failed_count += 1
+            # Skip files from different seasons; files that parsed but have
+            # no matching episode count as failures
+            skipped_count = int((~unparsed & ~same_season).sum())
+            failed_count = int(
+                (unparsed | (same_season & merged["episode_name"].isna())).sum()
+            )
+            success_count = len(matched)
 
-                except Exception:
-                    failed_count += 1
+            for row in matched.itertuples(index=False):
+                extension = os.path.splitext(row.name)[1]
+                new_name = f"{show_name}-S{season:02d}E{int(row.episode):02d}-{row.episode_name}{extension}"
+                st.session_state.renamed_files[row.name] = new_name
 
             # Show summary
             if success_count > 0:
@@ -376,47 +747,23 @@ class StreamlitTVShowRenamer:
 
     def extract_show_info(self, filename: str) -> Optional[Tuple[str, int, int]]:
         """Extract show name, season number, and episode number from filename."""
-        # Common patterns for TV show filenames
-        patterns = [
-            # [Tag]Show_-_01 (episode-only format)
-            r"\[.*?\](.*?)[-_\s]*(\d{2,})",
-            # Show.Name.S01E02 or Show.Name.S1E02
-            r"(.*?)[\.\s][Ss](\d{1,2})[Ee](\d{1,2})",
-            # Show.Name.1x02 or Show.Name.01x02
-            r"(.*?)[\.\s](\d{1,2})x(\d{1,2})",
-            # Show.Name.102 (where first digit is season, next two are episode)
-            r"(.*?)[\.\s](\d{1})(\d{2})",
-            # Show.Name.Season.1.Episode.02
-            r"(.*?)[\.\s][Ss]eason[\.\s]?(\d{1,2})[\.\s][Ee]pisode[\.\s]?(\d{1,2})",
-            # Show.Name.E02.S01
-            r"(.*?)[\.\s][Ee](\d{1,2})[\.\s][Ss](\d{1,2})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-
-                # Clean up show name
-                show_name = groups[0]
-                # Remove dots, underscores, brackets
-                show_name = re.sub(r"[\._\[\]]", " ", show_name)
-                # Remove multiple spaces and trim
-                show_name = " ".join(show_name.split()).strip()
-
-                if len(groups) == 2:  # Episode-only format
-                    season = 1  # Default to season 1
-                    episode = int(groups[1])
-                elif len(groups) == 3:
-                    if pattern == r"(.*?)[\.\s][Ee](\d{1,2})[\.\s][Ss](\d{1,2})":
-                        # Handle E02.S01 format (episode before season)
-                        season = int(groups[2])
-                        episode = int(groups[1])
-                    else:
-                        season = int(groups[1])
-                        episode = int(groups[2])
-
-                return show_name, season, episode
+        match = _SHOW_INFO_RE.search(filename)
+        if not match:
+            return None
+
+        for show_group, season_group, ep_group in _SHOW_INFO_GROUPS:
+            if match.group(ep_group) is None:
+                continue
+
+            # Clean up show name: drop dots, underscores, brackets,
+            # then collapse whitespace
+            show_name = _NAME_JUNK_RE.sub(" ", match.group(show_group))
+            show_name = " ".join(show_name.split()).strip()
+
+            # Layouts without a season group default to season 1
+            season = 1 if season_group is None else int(match.group(season_group))
+            episode = int(match.group(ep_group))
+            return show_name, season, episode
 
         return None
 
@@ -494,21 +841,53 @@ class StreamlitTVShowRenamer:
         if uploaded_files:
             self.handle_uploaded_files(uploaded_files)
 
+    @staticmethod
+    def _upload_key(file):
+        """Stable identity for an uploaded file across reruns."""
+        return getattr(file, "file_id", None) or (
+            file.name,
+            getattr(file, "size", None),
+        )
+
     def handle_uploaded_files(self, files):
-        """Handle uploaded files and store their paths."""
+        """Stream uploaded files to disk and store their paths."""
         if not files:
             return
 
-        # Clear existing files to prevent duplicates
+        # The uploader holds its files across reruns, so this runs on
+        # every interaction; skip restaging when the same set is already
+        # on disk
+        incoming_keys = [self._upload_key(file) for file in files]
+        staged_keys = [f.get("upload_key") for f in st.session_state.files]
+        if incoming_keys == staged_keys:
+            return
+
+        # Clear existing files to prevent duplicates, releasing their
+        # staged buffers
+        for file_info in st.session_state.files:
+            if file_info.get("temp_path"):
+                Path(file_info["temp_path"]).unlink(missing_ok=True)
         st.session_state.files = []
 
-        for file in files:
+        upload_dir = os.path.join(os.getcwd(), "uploads")
+        os.makedirs(upload_dir, exist_ok=True)
+
+        for file, upload_key in zip(files, incoming_keys):
             try:
-                # Store file info
+                # Stream the upload to disk in 1 MB chunks so multi-GB
+                # videos never sit fully in process memory; only the name
+                # and temp path are kept in session state.
+                with tempfile.NamedTemporaryFile(
+                    delete=False, dir=upload_dir, suffix=Path(file.name).suffix
+                ) as tmp:
+                    shutil.copyfileobj(file, tmp, length=1024 * 1024)
+                    size = tmp.tell()
+
                 file_info = {
                     "name": file.name,
-                    "size": getattr(file, "size", None),
-                    "urls": getattr(file, "_file_urls", None),
+                    "size": size,
+                    "temp_path": tmp.name,
+                    "upload_key": upload_key,
                     "status": "Ready",  # Initial status
                 }
                 st.session_state.files.append(file_info)
@@ -521,42 +900,63 @@ class StreamlitTVShowRenamer:
         success_count = 0
         failed_count = 0
 
-        with st.spinner("Renaming files..."):
-            for old_name, new_name in st.session_state.renamed_files.items():
-                file_info = next(
-                    (f for f in st.session_state.files if f["name"] == old_name), None
-                )
-                if file_info:
-                    file_info["status"] = "Processing..."
+        # Index the session files and the Downloads folders once instead
+        # of rescanning them for every renamed file
+        files_by_name = {f["name"]: f for f in st.session_state.files}
+        downloads_index = _index_downloads(os.path.expanduser("~/Downloads"))
 
-                try:
-                    downloads_dir = os.path.expanduser("~/Downloads")
-                    possible_paths = [
-                        os.path.join(downloads_dir, folder_name, old_name)
-                        for folder_name in os.listdir(downloads_dir)
-                        if os.path.isdir(os.path.join(downloads_dir, folder_name))
-                    ]
-
-                    actual_path = next(
-                        (path for path in possible_paths if os.path.exists(path)), None
-                    )
+        try:
+            with st.spinner("Renaming files..."):
+                for old_name, new_name in st.session_state.renamed_files.items():
+                    file_info = files_by_name.get(old_name)
+                    if file_info:
+                        file_info["status"] = "Processing..."
 
-                    if not actual_path:
-                        raise FileNotFoundError("File not found")
+                    try:
+                        actual_path = downloads_index.get(old_name)
 
-                    new_path = os.path.join(os.path.dirname(actual_path), new_name)
+                        if not actual_path:
+                            raise FileNotFoundError("File not found")
 
-                    if os.path.exists(new_path):
-                        raise FileExistsError("Destination exists")
+                        new_path = os.path.join(
+                            os.path.dirname(actual_path), new_name
+                        )
 
-                    os.rename(actual_path, new_path)
-                    file_info["status"] = "Success"
-                    success_count += 1
+                        # EAFP: claim the destination name atomically
+                        # (O_CREAT|O_EXCL fails if it is taken) instead of
+                        # an exists() probe, then move onto the placeholder
+                        try:
+                            os.close(
+                                os.open(
+                                    new_path,
+                                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                                )
+                            )
+                        except FileExistsError:
+                            raise FileExistsError("Destination exists") from None
 
-                except Exception as e:
-                    if file_info:
-                        file_info["status"] = f"Failed - {str(e)}"
-                    failed_count += 1
+                        try:
+                            os.replace(actual_path, new_path)
+                        except OSError:
+                            os.unlink(new_path)  # release the claimed name
+                            raise
+
+                        file_info["status"] = "Success"
+                        success_count += 1
+
+                    except Exception as e:
+                        if file_info:
+                            file_info["status"] = f"Failed - {str(e)}"
+                        failed_count += 1
+        finally:
+            # Best-effort: drop the upload buffers of files that renamed
+            # successfully, even when others in the batch failed; the
+            # startup sweep catches whatever is left behind
+            for file_info in st.session_state.files:
+                if file_info.get("status") == "Success" and file_info.get(
+                    "temp_path"
+                ):
+                    Path(file_info["temp_path"]).unlink(missing_ok=True)
 
         if success_count > 0:
             st.success(f"✓ Successfully renamed {success_count} file(s)")
@@ -567,54 +967,43 @@ class StreamlitTVShowRenamer:
             st.session_state.renamed_files.clear()
             st.session_state.files.clear()
 
-            upload_dir = os.path.join(os.getcwd(), "uploads")
-            if os.path.exists(upload_dir):
-                shutil.rmtree(upload_dir)
-
     def display_file_list(self):
         """Display the list of files to be renamed."""
         if not st.session_state.files:
             return
 
-        # Create DataFrame
-        data = []
-        for file in st.session_state.files:
-            new_name = st.session_state.renamed_files.get(file["name"], "")
-            # Update status based on successful rename
-            downloads_dir = os.path.expanduser("~/Downloads")
-            folder_path = next(
-                (
-                    folder
-                    for folder in Path(downloads_dir).iterdir()
-                    if folder.is_dir()
-                    and new_name in (f.name for f in folder.iterdir())
-                ),
-                None,
-            )
+        downloads_dir = os.path.expanduser("~/Downloads")
+        try:
+            mtime_ns = os.stat(downloads_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+
+        # Reruns with unchanged state reuse the cached table instead of
+        # rebuilding it row by row
+        df = _build_file_table(
+            tuple((f["name"], f["status"]) for f in st.session_state.files),
+            tuple(sorted(st.session_state.renamed_files.items())),
+            downloads_dir,
+            mtime_ns,
+        )
 
-            if new_name and folder_path:
-                file["status"] = "Success"
-            status = file["status"]
-            data.append(
-                {"Original Name": file["name"], "New Name": new_name, "Status": status}
+        # Build the Status CSS column in one vectorized pass instead of a
+        # Python call per cell
+        status_css = (
+            df["Status"]
+            .map(
+                {
+                    "Success": "color: #4caf50",
+                    "Processing...": "color: #2196f3",
+                    "Ready": "color: #ff9800",
+                }
             )
-
-        df = pd.DataFrame(data)
-
-        # Display the DataFrame with text wrapping
-        status_colors = {
-            "Success": "#4caf50",
-            "Processing...": "#2196f3",
-            "Ready": "#ff9800",
-        }
-
-        def apply_status_color(v):
-            if v.startswith("Failed"):
-                return "color: #f44336"
-            return f"color: {status_colors.get(v, '')}"
+            .where(~df["Status"].str.startswith("Failed"), "color: #f44336")
+            .fillna("")
+        )
 
         st.dataframe(
-            df.style.applymap(apply_status_color, subset=["Status"]).set_properties(
+            df.style.apply(lambda col: status_css, subset=["Status"]).set_properties(
                 **{
                     "text-align": "left",
                     "white-space": "pre-wrap",
@@ -630,45 +1019,35 @@ class StreamlitTVShowRenamer:
         success_count, failed_count = 0, 0
 
         with st.spinner("Undoing renames..."):
+            # Index the session files and the Downloads folders once
+            # instead of rescanning them for every renamed file
+            files_by_name = {f["name"]: f for f in st.session_state.files}
+            downloads_index = _index_downloads(str(Path.home() / "Downloads"))
+
             for old_name, new_name in st.session_state.renamed_files.items():
-                # Find file info for the current file
-                file_info = next(
-                    (f for f in st.session_state.files if f["name"] == old_name), None
-                )
+                file_info = files_by_name.get(old_name)
                 if file_info:
                     file_info["status"] = "Processing..."
 
                 try:
-                    # Determine folder path in Downloads
-                    downloads_dir = Path.home() / "Downloads"
-                    folder_path = next(
-                        (
-                            folder
-                            for folder in downloads_dir.iterdir()
-                            if folder.is_dir()
-                            and any(
-                                folder.joinpath(f).name == old_name
-                                for f in folder.iterdir()
-                            )
-                        ),
-                        None,
-                    )
-
-                    # Construct paths for old and new filenames
-                    new_path, old_path = os.path.join(
-                        folder_path, new_name
-                    ), os.path.join(folder_path, old_name)
-
-                    # Check if renamed file exists
-                    if not os.path.exists(new_path):
+                    # Locate the renamed file in Downloads
+                    new_path = downloads_index.get(new_name)
+                    if not new_path:
                         self._update_status(
                             file_info, "Failed - Renamed file not found"
                         )
                         failed_count += 1
                         continue
 
-                    # Check if original file already exists
-                    if os.path.exists(old_path):
+                    old_path = os.path.join(os.path.dirname(new_path), old_name)
+
+                    # EAFP: claim the original name atomically instead of
+                    # probing with exists()
+                    try:
+                        os.close(
+                            os.open(old_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                        )
+                    except FileExistsError:
                         self._update_status(
                             file_info, "Failed - Original name already exists"
                         )
@@ -676,7 +1055,11 @@ class StreamlitTVShowRenamer:
                         continue
 
                     # Rename file back to original
-                    os.rename(new_path, old_path)
+                    try:
+                        os.replace(new_path, old_path)
+                    except OSError:
+                        os.unlink(old_path)  # release the claimed name
+                        raise
                     self._update_status(file_info, "Ready")
                     success_count += 1
 
@@ -721,6 +1104,12 @@ class StreamlitTVShowRenamer:
         """Run the Streamlit application."""
         st.title("TV Show Renamer")
 
+        # Debug control for invalidating the shared TMDB caches
+        with st.sidebar:
+            if st.button("Clear TMDB cache"):
+                st.cache_data.clear()
+                st.success("Cache cleared")
+
         # Main layout
         self.display_drop_zone()
         self.select_tv_show()
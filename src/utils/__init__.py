@@ -6,10 +6,13 @@ from .helpers import (
     format_show_name,
     sanitize_log_message
 )
+from .rate_limiter import TokenBucket, TMDB_LIMITER
 
 __all__ = [
     'setup_logger',
     'log_safely',
     'format_show_name',
-    'sanitize_log_message'
+    'sanitize_log_message',
+    'TokenBucket',
+    'TMDB_LIMITER'
 ]
\ No newline at end of file
@@ -9,6 +9,9 @@ def setup_logger(name: str = "tv_show_renamer") -> logging.Logger:
     logger = logging.getLogger(name)
 
     if not logger.handlers:  # Prevent adding handlers multiple times
+        # Environment (.env) is loaded by the time loggers are configured,
+        # so capture the sensitive values for sanitization here
+        refresh_sensitive()
         logger.setLevel(logging.INFO)
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -22,16 +25,35 @@ def setup_logger(name: str = "tv_show_renamer") -> logging.Logger:
     return logger
 
 
+def _collect_sensitive_values() -> tuple:
+    """Capture (value, placeholder) pairs for the sensitive env keys."""
+    sensitive_keys = ("api_key", "TMDB_API_KEY", "token", "password")
+    return tuple(
+        (os.environ[key.upper()], f"[{key.upper()}_HIDDEN]")
+        for key in sensitive_keys
+        if os.environ.get(key.upper())
+    )
+
+
+# Captured once instead of re-scanning os.environ on every log line;
+# refreshed when a logger is first configured.
+_SENSITIVE = _collect_sensitive_values()
+
+
+def refresh_sensitive() -> None:
+    """Re-read the sensitive values from the environment."""
+    global _SENSITIVE
+    _SENSITIVE = _collect_sensitive_values()
+
+
 def sanitize_log_message(message: str) -> str:
     """Remove sensitive information from log messages."""
-    sensitive_keys = ["api_key", "TMDB_API_KEY", "token", "password"]
     sanitized_message = str(message)
+    if not _SENSITIVE:
+        return sanitized_message
 
-    for key in sensitive_keys:
-        if key.upper() in os.environ:
-            sanitized_message = sanitized_message.replace(
-                os.environ[key.upper()], f"[{key.upper()}_HIDDEN]"
-            )
+    for value, placeholder in _SENSITIVE:
+        sanitized_message = sanitized_message.replace(value, placeholder)
 
     return sanitized_message
 
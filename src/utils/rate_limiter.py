@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared across threads.
+
+    The bucket holds ``capacity`` tokens and refills completely every
+    ``refill_secs`` seconds, matching quota windows such as TMDB's
+    40 requests per 10 seconds. ``acquire`` blocks until a token is
+    available, so bursts queue briefly instead of failing with 429s.
+    """
+
+    def __init__(self, capacity: int = 40, refill_secs: float = 10.0):
+        self.capacity = capacity
+        self.refill_secs = refill_secs
+        self._tokens = capacity
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns 0.0 on success, otherwise the seconds until the next
+        refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.refill_secs:
+                self._tokens = self.capacity
+                self._window_start = now
+            if self._tokens > 0:
+                self._tokens -= 1
+                return 0.0
+            return max(self.refill_secs - (now - self._window_start), 0.01)
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire, but yields to the event loop while waiting.
+
+        Coroutines must use this path: a blocking acquire would freeze
+        the whole loop and serialize supposedly concurrent requests.
+        """
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+# Shared limiter for all outbound TMDB calls, sized to TMDB's
+# 40-requests-per-10-seconds ceiling. It lives here rather than in the
+# Streamlit main script because imported modules persist in sys.modules
+# across reruns, while main-script globals are rebuilt every time.
+TMDB_LIMITER = TokenBucket(capacity=40, refill_secs=10)